@@ -1,7 +1,23 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+def invalidate_dashboard_cache(sender, instance, **kwargs):
+    """Drop cached dashboard aggregates that include this application."""
+    from .services import DashboardCacheService
+    
+    DashboardCacheService.invalidate(instance.applicant_id)
 
 
 class ApplicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.applications'
     verbose_name = 'Applications'
+    
+    def ready(self):
+        """
+        Connect signals that invalidate cached dashboard aggregates.
+        """
+        Application = self.get_model('Application')
+        post_save.connect(invalidate_dashboard_cache, sender=Application)
+        post_delete.connect(invalidate_dashboard_cache, sender=Application)
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_application_title_trgm_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(condition=models.Q(('status', 'UNDER_REVIEW')), fields=['applicant'], name='app_under_review_idx'),
+        ),
+    ]
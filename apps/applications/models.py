@@ -3,7 +3,9 @@ Application models for Grant Application Workflow.
 Implements state machine, versioning, document management, and audit logging.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 from django.core.validators import MinValueValidator, FileExtensionValidator
 from django.utils import timezone
@@ -212,6 +214,15 @@ class Application(models.Model):
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['applicant', 'status']),
             models.Index(fields=['deadline']),
+            models.Index(
+                fields=['applicant'],
+                condition=models.Q(status='UNDER_REVIEW'),
+                name='app_under_review_idx'
+            ),
+            GinIndex(
+                OpClass(Upper('title'), name='gin_trgm_ops'),
+                name='application_title_trgm_idx'
+            ),
         ]
     
     def __str__(self):
@@ -3,9 +3,12 @@ Services for application management, versioning, and document handling.
 """
 
 from django.core.files.uploadedfile import UploadedFile
+from django.core.cache import cache
 from django.conf import settings
+from django.db import transaction
 import magic
 import os
+import time
 from .models import Application, ApplicationVersion, Document, AuditLog
 from .state_machine import create_audit_log
 
@@ -173,3 +176,58 @@ class DocumentService:
                 'filename': filename
             }
         )
+
+
+class DashboardCacheService:
+    """
+    Short-lived cache for dashboard aggregates over applications.
+    Keys embed a stamp that is bumped after an application is saved or
+    deleted, so stale entries are simply never read again. Only active with
+    a cache shared by all workers (settings.DASHBOARD_CACHE_ENABLED).
+    """
+    
+    TIMEOUT = 60
+    
+    @staticmethod
+    def _stamp_key(applicant_id=None):
+        if applicant_id is None:
+            return 'dash:applications:stamp'
+        return f'dash:applicant:{applicant_id}:stamp'
+    
+    @staticmethod
+    def get_or_set(name, compute, applicant_id=None):
+        """
+        Return the cached result of compute() for a dashboard aggregate.
+        
+        Args:
+            name: Aggregate name, part of the cache key
+            compute: Callable producing the value on a cache miss
+            applicant_id: Scope to one applicant's applications (None for all)
+        """
+        if not settings.DASHBOARD_CACHE_ENABLED:
+            return compute()
+        
+        stamp = cache.get_or_set(DashboardCacheService._stamp_key(applicant_id), time.time_ns, None)
+        scope = 'all' if applicant_id is None else applicant_id
+        return cache.get_or_set(
+            f'dash:{name}:{scope}:{stamp}', compute, DashboardCacheService.TIMEOUT
+        )
+    
+    @staticmethod
+    def invalidate(applicant_id):
+        """
+        Bump the stamps covering an applicant's applications once the current
+        transaction commits, so counts read before the commit are never
+        cached under the new stamp.
+        """
+        if not settings.DASHBOARD_CACHE_ENABLED:
+            return
+        
+        def bump():
+            stamp = time.time_ns()
+            cache.set_many({
+                DashboardCacheService._stamp_key(): stamp,
+                DashboardCacheService._stamp_key(applicant_id): stamp,
+            }, None)
+        
+        transaction.on_commit(bump)
@@ -6,12 +6,19 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import Http404
-from apps.users.permissions import can_view_application, can_edit_application, applicant_required
+from apps.users.permissions import (
+    annotate_permissions, can_view_application, can_edit_application, applicant_required
+)
 from .models import Application, ApplicationVersion, Document
 from .state_machine import ApplicationStateMachine, StateTransitionError
 from .services import ApplicationService, DocumentService
 
 
+def _get_viewable_application(user, pk):
+    """Fetch an application with the user's permission flags annotated."""
+    return get_object_or_404(annotate_permissions(Application.objects.all(), user), pk=pk)
+
+
 @login_required
 def application_list(request):
     """List applications based on user role."""
@@ -39,7 +46,7 @@ def application_list(request):
 @login_required
 def application_detail(request, pk):
     """View application details."""
-    application = get_object_or_404(Application, pk=pk)
+    application = _get_viewable_application(request.user, pk)
     
     if not can_view_application(request.user, application):
         raise Http404("Application not found")
@@ -128,7 +135,7 @@ def application_submit(request, pk):
 @login_required
 def version_history(request, pk):
     """View version history."""
-    application = get_object_or_404(Application, pk=pk)
+    application = _get_viewable_application(request.user, pk)
     
     if not can_view_application(request.user, application):
         raise Http404("Application not found")
@@ -28,8 +28,8 @@ def admin_dashboard(request):
     total_reviewers = User.objects.filter(role=User.Role.REVIEWER).count()
     
     # Average score
-    avg_score = Review.objects.filter(
-        status=Review.ReviewStatus.SUBMITTED
+    avg_score = ReviewAssignment.objects.filter(
+        overall_score__isnull=False
     ).aggregate(Avg('overall_score'))['overall_score__avg'] or 0
     
     # Application statistics by status
@@ -91,14 +91,21 @@ class ReviewAssignmentAdmin(admin.ModelAdmin):
         'rubric',
     ]
     
+    # Each lookup is backed by an index: trigram on UPPER(title), UPPER() expression
+    # indexes on the reviewer columns (see Application.Meta and User.Meta)
     search_fields = [
         'application__title',
-        'reviewer__username',
-        'reviewer__first_name',
-        'reviewer__last_name',
-        'reviewer__email',
+        '=reviewer__email',
+        'reviewer__username__istartswith',
+        'reviewer__first_name__istartswith',
+        'reviewer__last_name__istartswith',
     ]
     
+    search_help_text = (
+        'Search by application title, exact reviewer email, '
+        'or the start of a reviewer username, first or last name.'
+    )
+    
     list_per_page = 50
     
     readonly_fields = ['assigned_date']
@@ -1,7 +1,33 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+def sync_assignment_score(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep ReviewAssignment.overall_score equal to the score of its submitted
+    review, so reverting (e.g. in the admin) or deleting a review drops it.
+    """
+    from .models import ReviewAssignment
+    
+    # Draft autosaves only write scores/comments
+    if update_fields is not None and not {'status', 'overall_score'} & set(update_fields):
+        return
+    
+    submitted = kwargs.get('signal') is post_save and instance.status == instance.ReviewStatus.SUBMITTED
+    ReviewAssignment.objects.filter(pk=instance.assignment_id).update(
+        overall_score=instance.overall_score if submitted else None
+    )
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.reviews'
     verbose_name = 'Reviews'
+    
+    def ready(self):
+        """
+        Connect signals that keep the denormalized assignment score in sync.
+        """
+        Review = self.get_model('Review')
+        post_save.connect(sync_assignment_score, sender=Review)
+        post_delete.connect(sync_assignment_score, sender=Review)
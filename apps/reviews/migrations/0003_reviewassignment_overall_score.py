@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:29
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_overall_score(apps, schema_editor):
+    ReviewAssignment = apps.get_model('reviews', 'ReviewAssignment')
+    Review = apps.get_model('reviews', 'Review')
+    ReviewAssignment.objects.update(
+        overall_score=Subquery(
+            Review.objects.filter(
+                assignment=OuterRef('pk'),
+                status='SUBMITTED'
+            ).values('overall_score')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_calibrationsession_calibrationscore'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewassignment',
+            name='overall_score',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, help_text='Overall score of the submitted review (0-100)', max_digits=5, null=True),
+        ),
+        migrations.RunPython(backfill_overall_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_application_title_trgm_idx'),
+        ('reviews', '0003_reviewassignment_overall_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='coiflag',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='reviewassignment',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='coiflag',
+            constraint=models.UniqueConstraint(fields=('application', 'reviewer'), name='coiflag_application_reviewer_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewassignment',
+            constraint=models.UniqueConstraint(fields=('application', 'reviewer'), name='reviewassignment_application_reviewer_uniq'),
+        ),
+    ]
@@ -64,8 +64,9 @@ class Rubric(models.Model):
         
         weighted_sum = Decimal('0')
         for criterion in self.criteria.all():
-            score = Decimal(str(scores_dict.get(str(criterion.id), 0)))
-            max_score = Decimal(str(criterion.max_score))
+            raw = scores_dict.get(str(criterion.id), 0)
+            score = Decimal(raw) if isinstance(raw, int) else Decimal(str(raw))
+            max_score = Decimal(criterion.max_score)
             weighted_sum += (score / max_score) * criterion.weight
         
         return (weighted_sum / total_weight) * Decimal('100')
@@ -193,9 +194,24 @@ class ReviewAssignment(models.Model):
         help_text="Admin notes about this assignment"
     )
     
+    # Denormalized copy of the submitted review's score for ranking queries
+    overall_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Overall score of the submitted review (0-100)"
+    )
+    
     class Meta:
         ordering = ['-assigned_date']
-        unique_together = ['application', 'reviewer']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['application', 'reviewer'],
+                name='reviewassignment_application_reviewer_uniq'
+            ),
+        ]
         indexes = [
             models.Index(fields=['reviewer', 'status']),
             models.Index(fields=['application', 'status']),
@@ -310,9 +326,10 @@ class Review(models.Model):
         self.calculate_overall_score()
         self.save()
         
-        # Update assignment status
+        # Update assignment status and denormalized score
         self.assignment.status = ReviewAssignment.AssignmentStatus.COMPLETED
-        self.assignment.save()
+        self.assignment.overall_score = self.overall_score
+        self.assignment.save(update_fields=['status', 'overall_score'])
         
         # Update application status to REVIEWED if all reviews are completed
         from apps.applications.models import ApplicationStatus
@@ -385,7 +402,12 @@ class COIFlag(models.Model):
     
     class Meta:
         ordering = ['-declared_at']
-        unique_together = ['reviewer', 'application']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['application', 'reviewer'],
+                name='coiflag_application_reviewer_uniq'
+            ),
+        ]
     
     def __str__(self):
         return f"COI: {self.reviewer.get_full_name()} - {self.application.title}"
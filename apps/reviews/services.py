@@ -2,7 +2,13 @@
 Services for reviewer assignment, load balancing, and COI detection.
 """
 
-from django.db.models import Q, Count
+import heapq
+from functools import reduce
+from operator import or_
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Avg, Min, Max, StdDev, Exists, OuterRef, F, FloatField
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
 from django.utils import timezone
 from datetime import timedelta
 from .models import ReviewAssignment, Review, COIFlag, Rubric
@@ -11,6 +17,10 @@ from apps.applications.state_machine import create_audit_log
 from apps.applications.models import AuditLog
 
 
+COI_ERROR = "Reviewer has declared a conflict of interest for this application."
+ALREADY_ASSIGNED_ERROR = "Reviewer is already assigned to this application."
+
+
 class ReviewerAssignmentService:
     """
     Service for intelligent reviewer assignment with load balancing and expertise matching.
@@ -29,36 +39,40 @@ class ReviewerAssignmentService:
         Returns:
             QuerySet of recommended User instances with annotation
         """
-        # Get all active reviewers
-        reviewers = User.objects.filter(
-            role=User.Role.REVIEWER,
-            is_active=True
+        # Active reviewers without a COI or an existing assignment, in one query
+        reviewers = list(
+            User.objects.filter(
+                role=User.Role.REVIEWER,
+                is_active=True
+            ).exclude(
+                Exists(COIFlag.objects.filter(application=application, reviewer=OuterRef('pk')))
+            ).exclude(
+                Exists(ReviewAssignment.objects.filter(application=application, reviewer=OuterRef('pk')))
+            ).only(
+                'id', 'username', 'first_name', 'last_name', 'role', 'expertise_tags', 'current_load'
+            )
         )
         
-        # Exclude reviewers with COI
-        reviewers_with_coi = COIFlag.objects.filter(
-            application=application
-        ).values_list('reviewer_id', flat=True)
-        reviewers = reviewers.exclude(id__in=reviewers_with_coi)
-        
-        # Exclude reviewers already assigned to this application
-        already_assigned = ReviewAssignment.objects.filter(
-            application=application
-        ).values_list('reviewer_id', flat=True)
-        reviewers = reviewers.exclude(id__in=already_assigned)
+        # Intern every tag into a bit position so each reviewer's expertise
+        # becomes a single int and Jaccard reduces to two popcounts
+        vocab = {}
+        for tag in application.tags:
+            vocab.setdefault(tag, 1 << len(vocab))
+        for reviewer in reviewers:
+            for tag in reviewer.expertise_tags:
+                vocab.setdefault(tag, 1 << len(vocab))
         
-        # Calculate expertise match score
-        app_tags = set(application.tags)
+        app_bits = reduce(or_, (vocab[t] for t in application.tags), 0)
         
         scored_reviewers = []
         for reviewer in reviewers:
-            reviewer_tags = set(reviewer.expertise_tags)
+            reviewer_bits = reduce(or_, (vocab[t] for t in reviewer.expertise_tags), 0)
             
             # Calculate Jaccard similarity for expertise matching
-            if app_tags and reviewer_tags:
-                intersection = len(app_tags & reviewer_tags)
-                union = len(app_tags | reviewer_tags)
-                expertise_score = intersection / union if union > 0 else 0
+            if app_bits and reviewer_bits:
+                intersection = (app_bits & reviewer_bits).bit_count()
+                union = (app_bits | reviewer_bits).bit_count()
+                expertise_score = intersection / union
             else:
                 expertise_score = 0
             
@@ -77,10 +91,8 @@ class ReviewerAssignmentService:
                 'current_load': reviewer.current_load,
             })
         
-        # Sort by combined score (descending)
-        scored_reviewers.sort(key=lambda x: x['combined_score'], reverse=True)
-        
-        return scored_reviewers[:num_recommendations]
+        # Top candidates by combined score, without sorting the whole pool
+        return heapq.nlargest(num_recommendations, scored_reviewers, key=lambda x: x['combined_score'])
     
     @staticmethod
     def assign_reviewer(application, reviewer, rubric, assigned_by, due_days=14, is_blinded=True, notes=''):
@@ -101,27 +113,28 @@ class ReviewerAssignmentService:
         """
         # Check if reviewer has COI
         if COIFlag.objects.filter(application=application, reviewer=reviewer).exists():
-            return None, "Reviewer has declared a conflict of interest for this application."
-        
-        # Check if already assigned
-        if ReviewAssignment.objects.filter(application=application, reviewer=reviewer).exists():
-            return None, "Reviewer is already assigned to this application."
+            return None, COI_ERROR
         
-        # Create assignment
+        # Create assignment; the application/reviewer unique constraint
+        # rejects duplicates without a separate existence query
         due_date = timezone.now() + timedelta(days=due_days)
         
-        assignment = ReviewAssignment.objects.create(
-            application=application,
-            reviewer=reviewer,
-            rubric=rubric,
-            assigned_by=assigned_by,
-            due_date=due_date,
-            is_blinded=is_blinded,
-            notes=notes
-        )
+        try:
+            with transaction.atomic():
+                assignment = ReviewAssignment.objects.create(
+                    application=application,
+                    reviewer=reviewer,
+                    rubric=rubric,
+                    assigned_by=assigned_by,
+                    due_date=due_date,
+                    is_blinded=is_blinded,
+                    notes=notes
+                )
+        except IntegrityError:
+            return None, ALREADY_ASSIGNED_ERROR
         
         # Increment reviewer load
-        reviewer.increment_load()
+        reviewer.increment_load(refresh=False)
         
         # Create audit log
         create_audit_log(
@@ -157,26 +170,67 @@ class ReviewerAssignmentService:
         """
         assignments = []
         errors = []
+        due_date = timezone.now() + timedelta(days=due_days)
         
-        for reviewer_id in reviewer_ids:
-            try:
-                reviewer = User.objects.get(id=reviewer_id, role=User.Role.REVIEWER)
-                assignment, error = ReviewerAssignmentService.assign_reviewer(
+        with transaction.atomic():
+            reviewers = {
+                str(reviewer.pk): reviewer
+                for reviewer in User.objects.filter(id__in=reviewer_ids, role=User.Role.REVIEWER)
+            }
+            coi_reviewer_ids = set(
+                COIFlag.objects.filter(application=application).values_list('reviewer_id', flat=True)
+            )
+            assigned_reviewer_ids = set(
+                ReviewAssignment.objects.filter(application=application).values_list('reviewer_id', flat=True)
+            )
+            
+            to_assign = []
+            for reviewer_id in reviewer_ids:
+                reviewer = reviewers.get(str(reviewer_id))
+                if reviewer is None:
+                    errors.append(f"Reviewer ID {reviewer_id} not found")
+                elif reviewer.pk in coi_reviewer_ids:
+                    errors.append(f"{reviewer.username}: {COI_ERROR}")
+                elif reviewer.pk in assigned_reviewer_ids:
+                    errors.append(f"{reviewer.username}: {ALREADY_ASSIGNED_ERROR}")
+                else:
+                    assigned_reviewer_ids.add(reviewer.pk)
+                    to_assign.append(reviewer)
+            
+            if not to_assign:
+                return assignments, errors
+            
+            assignments = ReviewAssignment.objects.bulk_create([
+                ReviewAssignment(
                     application=application,
                     reviewer=reviewer,
                     rubric=rubric,
                     assigned_by=assigned_by,
-                    due_days=due_days,
+                    due_date=due_date,
                     is_blinded=is_blinded
                 )
-                
-                if assignment:
-                    assignments.append(assignment)
-                else:
-                    errors.append(f"{reviewer.username}: {error}")
+                for reviewer in to_assign
+            ], batch_size=500)
+            
+            User.objects.filter(
+                id__in=[reviewer.pk for reviewer in to_assign]
+            ).update(current_load=F('current_load') + 1)
             
-            except User.DoesNotExist:
-                errors.append(f"Reviewer ID {reviewer_id} not found")
+            AuditLog.objects.bulk_create([
+                AuditLog(
+                    action_type=AuditLog.ActionType.REVIEW_ASSIGNED,
+                    actor=assigned_by,
+                    application=application,
+                    details={
+                        'reviewer_id': str(reviewer.id),
+                        'reviewer_name': reviewer.get_full_name() or reviewer.username,
+                        'rubric': rubric.name,
+                        'due_date': due_date.isoformat(),
+                        'is_blinded': is_blinded
+                    }
+                )
+                for reviewer in to_assign
+            ], batch_size=500)
         
         return assignments, errors
     
@@ -193,24 +247,26 @@ class ReviewerAssignmentService:
         application = assignment.application
         reviewer = assignment.reviewer
         
-        # Decrement reviewer load
-        reviewer.decrement_load()
-        
-        # Create audit log before deletion
-        create_audit_log(
-            action_type=AuditLog.ActionType.OTHER,
-            actor=unassigned_by,
-            application=application,
-            details={
-                'action': 'reviewer_unassigned',
-                'reviewer_id': str(reviewer.id),
-                'reviewer_name': reviewer.get_full_name() or reviewer.username,
-                'reason': reason
-            }
-        )
-        
-        # Delete assignment (cascade will delete review if exists)
-        assignment.delete()
+        # Load decrement, audit log and deletion commit or roll back together
+        with transaction.atomic():
+            # Decrement reviewer load (single atomic UPDATE)
+            reviewer.decrement_load(refresh=False)
+            
+            # Create audit log before deletion
+            create_audit_log(
+                action_type=AuditLog.ActionType.OTHER,
+                actor=unassigned_by,
+                application=application,
+                details={
+                    'action': 'reviewer_unassigned',
+                    'reviewer_id': str(reviewer.id),
+                    'reviewer_name': reviewer.get_full_name() or reviewer.username,
+                    'reason': reason
+                }
+            )
+            
+            # Delete assignment (cascade will delete review if exists)
+            assignment.delete()
 
 
 class COIService:
@@ -272,13 +328,13 @@ class COIService:
             warnings.append("Same organization as applicant")
         
         # Check if reviewer has reviewed other applications from same applicant
-        previous_reviews = ReviewAssignment.objects.filter(
+        previous_count = ReviewAssignment.objects.filter(
             reviewer=reviewer,
             application__applicant=application.applicant
-        ).exclude(application=application)
+        ).exclude(application=application).count()
         
-        if previous_reviews.exists():
-            warnings.append(f"Previously reviewed {previous_reviews.count()} applications from this applicant")
+        if previous_count:
+            warnings.append(f"Previously reviewed {previous_count} applications from this applicant")
         
         return warnings
 
@@ -297,12 +353,19 @@ class ScoringService:
         Returns:
             Dictionary of statistics
         """
-        reviews = Review.objects.filter(
-            assignment__application=application,
-            status=Review.ReviewStatus.SUBMITTED
+        # overall_score is only copied onto the assignment when its review is submitted
+        stats = ReviewAssignment.objects.filter(
+            application=application,
+            overall_score__isnull=False
+        ).aggregate(
+            review_count=Count('id'),
+            mean_score=Avg('overall_score'),
+            min_score=Min('overall_score'),
+            max_score=Max('overall_score'),
+            std_dev=StdDev('overall_score', sample=True),
         )
         
-        if not reviews.exists():
+        if stats['review_count'] == 0:
             return {
                 'review_count': 0,
                 'mean_score': None,
@@ -311,26 +374,13 @@ class ScoringService:
                 'std_dev': None,
             }
         
-        scores = [float(r.overall_score) for r in reviews if r.overall_score is not None]
-        
-        if not scores:
-            return {'review_count': reviews.count(), 'mean_score': None}
-        
-        mean_score = sum(scores) / len(scores)
-        
-        # Calculate standard deviation
-        if len(scores) > 1:
-            variance = sum((x - mean_score) ** 2 for x in scores) / (len(scores) - 1)
-            std_dev = variance ** 0.5
-        else:
-            std_dev = 0
-        
         return {
-            'review_count': len(scores),
-            'mean_score': mean_score,
-            'min_score': min(scores),
-            'max_score': max(scores),
-            'std_dev': std_dev,
+            'review_count': stats['review_count'],
+            'mean_score': float(stats['mean_score']),
+            'min_score': float(stats['min_score']),
+            'max_score': float(stats['max_score']),
+            # Sample standard deviation is undefined for a single review
+            'std_dev': float(stats['std_dev'] or 0),
         }
     
     @staticmethod
@@ -354,32 +404,39 @@ class ScoringService:
         if applications:
             reviews_query = reviews_query.filter(assignment__application__in=applications)
         
+        criteria = list(rubric.criteria.values_list('id', 'name'))
+        if not criteria:
+            return {}
+        
+        # Let Postgres compute every criterion's statistics over the JSON
+        # scores in a single aggregate query
+        aggregates = {}
+        for i, (criterion_id, _) in enumerate(criteria):
+            score = Cast(KT(f'scores__{criterion_id}'), FloatField())
+            aggregates.update({
+                f'c{i}_count': Count(score),
+                f'c{i}_mean': Avg(score),
+                f'c{i}_min': Min(score),
+                f'c{i}_max': Max(score),
+                f'c{i}_std_dev': StdDev(score, sample=True),
+            })
+        
+        results = reviews_query.aggregate(**aggregates)
+        
         criterion_stats = {}
         
-        for criterion in rubric.criteria.all():
-            criterion_id = str(criterion.id)
-            scores = []
-            
-            for review in reviews_query:
-                if criterion_id in review.scores:
-                    scores.append(review.scores[criterion_id])
+        for i, (criterion_id, criterion_name) in enumerate(criteria):
+            count = results[f'c{i}_count']
             
-            if scores:
-                mean_score = sum(scores) / len(scores)
-                
-                if len(scores) > 1:
-                    variance = sum((x - mean_score) ** 2 for x in scores) / (len(scores) - 1)
-                    std_dev = variance ** 0.5
-                else:
-                    std_dev = 0
-                
-                criterion_stats[criterion_id] = {
-                    'criterion_name': criterion.name,
-                    'count': len(scores),
-                    'mean': mean_score,
-                    'min': min(scores),
-                    'max': max(scores),
-                    'std_dev': std_dev,
+            if count:
+                criterion_stats[str(criterion_id)] = {
+                    'criterion_name': criterion_name,
+                    'count': count,
+                    'mean': results[f'c{i}_mean'],
+                    'min': results[f'c{i}_min'],
+                    'max': results[f'c{i}_max'],
+                    # Sample standard deviation is undefined for a single score
+                    'std_dev': results[f'c{i}_std_dev'] or 0.0,
                 }
         
         return criterion_stats
@@ -23,11 +23,11 @@ def get_item(dictionary, key):
 
 @register.filter
 def filter_required(queryset):
-    """Filter queryset to only required items."""
-    return queryset.filter(is_required=True)
+    """Filter to only required items, reusing already-fetched or prefetched rows."""
+    return [obj for obj in queryset if getattr(obj, 'is_required', False)]
 
 
-@register.filter
+@register.filter(is_safe=True)
 def map_attr(queryset, attr):
-    """Map queryset to list of attribute values."""
-    return list(queryset.values_list(attr, flat=True))
+    """Map items to a list of attribute values, reusing already-fetched or prefetched rows."""
+    return [getattr(obj, attr) for obj in queryset]
@@ -2,13 +2,27 @@
 Views for reviews app.
 """
 
+import json
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import Http404, JsonResponse
+from django.db.models import Count, Q
 from apps.users.permissions import reviewer_required, can_review_application
 from .models import ReviewAssignment, Review, COIFlag
+from .services import COIService
 from apps.applications.models import Application
+from apps.notifications.services import NotificationService
+
+
+def _get_assignment(pk):
+    """Fetch an assignment with its rubric criteria, application and reviewer preloaded."""
+    return get_object_or_404(
+        ReviewAssignment.objects.select_related(
+            'rubric', 'application__applicant', 'reviewer'
+        ).prefetch_related('rubric__criteria'),
+        pk=pk
+    )
 
 
 @login_required
@@ -35,13 +49,15 @@ def assignment_list(request):
         messages.error(request, "You do not have permission to view review assignments.")
         return redirect('dashboard')
     
-    pending_count = assignments.filter(status__in=['ASSIGNED', 'IN_PROGRESS']).count()
-    completed_count = assignments.filter(status='COMPLETED').count()
+    counts = assignments.aggregate(
+        pending=Count('id', filter=Q(status__in=['ASSIGNED', 'IN_PROGRESS'])),
+        completed=Count('id', filter=Q(status='COMPLETED')),
+    )
     
     return render(request, 'reviews/assignment_list.html', {
         'assignments': assignments,
-        'pending_count': pending_count,
-        'completed_count': completed_count,
+        'pending_count': counts['pending'],
+        'completed_count': counts['completed'],
         'is_admin_view': is_admin_view
     })
 
@@ -49,35 +65,34 @@ def assignment_list(request):
 @reviewer_required
 def review_interface(request, pk):
     """Blinded review interface."""
-    assignment = get_object_or_404(ReviewAssignment, pk=pk)
+    assignment = _get_assignment(pk)
     
     if assignment.reviewer != request.user:
         raise Http404("Assignment not found")
     
     # Get or create review
     review, created = Review.objects.get_or_create(assignment=assignment)
+    criteria = list(assignment.rubric.criteria.all())
     
     if request.method == 'POST':
         # Save scores
-        scores = {}
-        for criterion in assignment.rubric.criteria.all():
-            score_key = f'score_{criterion.id}'
-            if score_key in request.POST:
-                scores[str(criterion.id)] = int(request.POST[score_key])
-        
-        review.scores = scores
+        review.scores = {
+            str(c.id): int(request.POST[f'score_{c.id}'])
+            for c in criteria if f'score_{c.id}' in request.POST
+        }
         review.strengths = request.POST.get('strengths', '')
         review.weaknesses = request.POST.get('weaknesses', '')
         review.recommendation = request.POST.get('recommendation', '')
         review.confidential_comments = request.POST.get('confidential_comments', '')
         
         # Save as draft
-        review.save()
+        review.save(update_fields=[
+            'scores', 'strengths', 'weaknesses', 'recommendation',
+            'confidential_comments', 'updated_at'
+        ])
         messages.success(request, 'Review saved as draft.')
         return redirect('reviews:review_interface', pk=pk)
     
-    criteria = assignment.rubric.criteria.all()
-    
     return render(request, 'reviews/review_interface.html', {
         'assignment': assignment,
         'review': review,
@@ -89,7 +104,7 @@ def review_interface(request, pk):
 @reviewer_required
 def review_submit(request, pk):
     """Submit review."""
-    assignment = get_object_or_404(ReviewAssignment, pk=pk)
+    assignment = _get_assignment(pk)
     
     if assignment.reviewer != request.user:
         raise Http404("Assignment not found")
@@ -99,7 +114,6 @@ def review_submit(request, pk):
         review.submit()
         
         # Notify admins
-        from apps.notifications.services import NotificationService
         NotificationService.notify_admin_review_completed(review)
         
         messages.success(request, 'Review submitted successfully.')
@@ -120,7 +134,6 @@ def declare_coi(request, application_id):
         coi_type = request.POST.get('coi_type')
         description = request.POST.get('description')
         
-        from .services import COIService
         coi_flag = COIService.declare_coi(
             reviewer=request.user,
             application=application,
@@ -129,7 +142,6 @@ def declare_coi(request, application_id):
         )
         
         # Notify admins
-        from apps.notifications.services import NotificationService
         NotificationService.notify_admin_coi_declared(coi_flag)
         
         messages.success(request, 'Conflict of interest declared.')
@@ -146,25 +158,24 @@ def save_review_score(request, pk):
     if request.method != 'POST':
         return JsonResponse({'status': 'error', 'message': 'Only POST allowed'}, status=405)
         
-    assignment = get_object_or_404(ReviewAssignment, pk=pk)
+    assignment = _get_assignment(pk)
     
     if assignment.reviewer != request.user:
         return JsonResponse({'status': 'error', 'message': 'Not authorized'}, status=403)
         
-    import json
     try:
         data = json.loads(request.body)
-        criterion_id = str(data.get('criterion_id'))
-        score = int(data.get('score'))
-        
-        review, created = Review.objects.get_or_create(assignment=assignment)
-        
-        # Update scores
-        scores = review.scores or {}
-        scores[criterion_id] = score
-        review.scores = scores
-        review.save()
-        
-        return JsonResponse({'status': 'success', 'overall_score': review.overall_score})
-    except Exception as e:
+        criterion_id = str(data['criterion_id'])
+        score = int(data['score'])
+    except (ValueError, KeyError, TypeError) as e:
         return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
+    
+    review, created = Review.objects.get_or_create(assignment=assignment)
+    
+    # Update scores
+    scores = review.scores or {}
+    scores[criterion_id] = score
+    review.scores = scores
+    review.save(update_fields=['scores', 'updated_at'])
+    
+    return JsonResponse({'status': 'success', 'overall_score': review.overall_score})
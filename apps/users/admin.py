@@ -7,7 +7,8 @@ Shows role-group synchronization status.
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
-from .models import User
+from django.db.models import Count
+from .models import User, _ROLE_GROUP_NAMES
 
 
 # Customize Group admin to show related users
@@ -18,25 +19,34 @@ class GroupAdmin(admin.ModelAdmin):
     search_fields = ['name']
     filter_horizontal = ['permissions']
     
+    def get_queryset(self, request):
+        """Annotate user and permission counts so the changelist needs one query."""
+        return super().get_queryset(request).annotate(
+            _user_count=Count('user', distinct=True),
+            _perm_count=Count('permissions', distinct=True),
+        )
+    
     def get_user_count(self, obj):
         """Display number of users in this group."""
-        return obj.user_set.count()
+        return obj._user_count
     get_user_count.short_description = 'Users'
+    get_user_count.admin_order_field = '_user_count'
     
     def get_permissions_count(self, obj):
         """Display number of permissions assigned to this group."""
-        return obj.permissions.count()
+        return obj._perm_count
     get_permissions_count.short_description = 'Permissions'
+    get_permissions_count.admin_order_field = '_perm_count'
     
     def get_readonly_fields(self, request, obj=None):
         """Make role-based group names read-only."""
-        if obj and obj.name in ['Applicants', 'Reviewers', 'Admins']:
+        if obj and obj.name in _ROLE_GROUP_NAMES:
             return ['name']
         return []
     
     def has_delete_permission(self, request, obj=None):
         """Prevent deletion of role-based groups."""
-        if obj and obj.name in ['Applicants', 'Reviewers', 'Admins']:
+        if obj and obj.name in _ROLE_GROUP_NAMES:
             return False
         return super().has_delete_permission(request, obj)
 
@@ -122,16 +132,18 @@ class UserAdmin(BaseUserAdmin):
     
     def get_group_name(self, obj):
         """Display the role-based group name."""
-        return obj.ROLE_GROUP_MAP.get(obj.role, '-')
+        return obj.group_for_role(obj.role) or '-'
     get_group_name.short_description = 'Auto Group'
     
     def get_assigned_group(self, obj):
         """Display the assigned group with permission count."""
-        group_name = obj.ROLE_GROUP_MAP.get(obj.role)
+        group_name = obj.group_for_role(obj.role)
         if group_name:
             try:
-                group = Group.objects.get(name=group_name)
-                perm_count = group.permissions.count()
+                # Not cached: a count from another worker's cache could be stale
+                perm_count = Group.objects.annotate(
+                    n=Count('permissions')
+                ).values_list('n', flat=True).get(name=group_name)
                 return f"{group_name} ({perm_count} permissions)"
             except Group.DoesNotExist:
                 return f"{group_name} (not created yet)"
@@ -145,7 +157,7 @@ class UserAdmin(BaseUserAdmin):
         super().save_model(request, obj, form, change)
         
         from django.contrib import messages
-        group_name = obj.ROLE_GROUP_MAP.get(obj.role)
+        group_name = obj.group_for_role(obj.role)
         if group_name:
             messages.info(
                 request, 
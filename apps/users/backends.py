@@ -0,0 +1,56 @@
+"""
+Authentication backends for Grant Application Workflow.
+Loads a user's permissions, including those of their role group, in one query.
+"""
+
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Permission
+from django.db.models import CharField, Value
+
+
+class RolePermissionBackend(ModelBackend):
+    """
+    Permission-only ModelBackend that fills ModelBackend's per-user caches
+    (``_user_perm_cache`` and ``_group_perm_cache``, where the role group's
+    permissions land) with a single UNION query instead of one query each.
+    
+    Authentication is left to ModelBackend, which stays listed after this
+    backend so existing sessions keep a valid backend path. Because the cache
+    attributes are shared, ModelBackend's own has_perm() reuses them.
+    """
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        return None
+    
+    def _load_permissions(self, user_obj, obj=None):
+        """Populate the user and group permission caches in one query, if not cached yet."""
+        if (
+            not user_obj.is_active
+            or user_obj.is_anonymous
+            or user_obj.is_superuser
+            or obj is not None
+            or (hasattr(user_obj, '_user_perm_cache') and hasattr(user_obj, '_group_perm_cache'))
+        ):
+            return
+        
+        def perms(source, **lookup):
+            return Permission.objects.filter(**lookup).annotate(
+                source=Value(source, output_field=CharField())
+            ).values_list('content_type__app_label', 'codename', 'source').order_by()
+        
+        user_perms, group_perms = set(), set()
+        for app_label, codename, source in perms('user', user=user_obj).union(
+            perms('group', group__user=user_obj), all=True
+        ):
+            (user_perms if source == 'user' else group_perms).add(f'{app_label}.{codename}')
+        
+        user_obj._user_perm_cache = user_perms
+        user_obj._group_perm_cache = group_perms
+    
+    def get_user_permissions(self, user_obj, obj=None):
+        self._load_permissions(user_obj, obj)
+        return super().get_user_permissions(user_obj, obj)
+    
+    def get_group_permissions(self, user_obj, obj=None):
+        self._load_permissions(user_obj, obj)
+        return super().get_group_permissions(user_obj, obj)
@@ -2,11 +2,16 @@
 Forms for user management.
 """
 
+import re
+import sys
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from .models import User
 
 
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+
 class UserRegistrationForm(UserCreationForm):
     """Form for new user registration with role selection."""
     
@@ -76,7 +81,7 @@ class ProfileEditForm(forms.ModelForm):
         # Process expertise_tags from comma-separated input
         expertise_input = self.cleaned_data.get('expertise_tags_input', '')
         if expertise_input:
-            user.expertise_tags = [tag.strip() for tag in expertise_input.split(',') if tag.strip()]
+            user.expertise_tags = [sys.intern(tag) for tag in _TAG_SPLIT.split(expertise_input.strip()) if tag]
         else:
             user.expertise_tags = []
         if commit:
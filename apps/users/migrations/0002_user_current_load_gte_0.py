@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('APPLICANT', 'Applicant'), ('REVIEWER', 'Reviewer'), ('ADMIN', 'Admin')], default='APPLICANT', help_text="User's role in the system. Changing this will automatically update group membership.", max_length=20),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(check=models.Q(('current_load__gte', 0)), name='user_current_load_gte_0'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_user_current_load_gte_0'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('role', 'REVIEWER')), fields=['current_load'], name='reviewer_load_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:49
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0003_reviewer_load_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['expertise_tags'], name='user_expertise_gin'),
+        ),
+    ]
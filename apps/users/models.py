@@ -4,8 +4,12 @@ Implements role-based user system with APPLICANT, REVIEWER, and ADMIN roles.
 Includes automatic synchronization between roles and Django Groups.
 """
 
-from django.contrib.auth.models import AbstractUser, Group
-from django.db import models
+from types import MappingProxyType
+from django.contrib.auth.models import AbstractUser, Group, Permission
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.core.validators import MinValueValidator
 
 
@@ -20,12 +24,12 @@ class User(AbstractUser):
         REVIEWER = 'REVIEWER', 'Reviewer'
         ADMIN = 'ADMIN', 'Admin'
     
-    # Mapping from role to group name
-    ROLE_GROUP_MAP = {
+    # Mapping from role to group name (read-only)
+    ROLE_GROUP_MAP = MappingProxyType({
         'APPLICANT': 'Applicants',
         'REVIEWER': 'Reviewers',
         'ADMIN': 'Admins',
-    }
+    })
     
     role = models.CharField(
         max_length=20,
@@ -68,51 +72,99 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=['role']),
             models.Index(fields=['current_load']),
+            # Backs the reviewer load listing (role=REVIEWER ordered by current_load)
+            models.Index(
+                fields=['current_load'],
+                condition=models.Q(role='REVIEWER'),
+                name='reviewer_load_idx'
+            ),
+            # Supports expertise_tags__contains / has_key lookups for reviewer matching
+            GinIndex(fields=['expertise_tags'], name='user_expertise_gin'),
+            # Admin search compiles =email to UPPER(email) = UPPER(...) and
+            # __istartswith to UPPER(col) LIKE UPPER('x%'), so index the same expressions
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+            models.Index(
+                OpClass(Upper('username'), name='text_pattern_ops'),
+                name='user_username_upper_idx'
+            ),
+            models.Index(
+                OpClass(Upper('first_name'), name='text_pattern_ops'),
+                name='user_first_name_upper_idx'
+            ),
+            models.Index(
+                OpClass(Upper('last_name'), name='text_pattern_ops'),
+                name='user_last_name_upper_idx'
+            ),
+        ]
+        constraints = [
+            # increment_load/decrement_load use UPDATE ... F(), which bypasses field validators
+            models.CheckConstraint(check=models.Q(current_load__gte=0), name='user_current_load_gte_0'),
         ]
     
     def __str__(self):
         return f"{self.get_full_name() or self.username} ({self.get_role_display()})"
     
+    @classmethod
+    def group_for_role(cls, role):
+        """Return the name of the Django Group backing a role, or None."""
+        return cls.ROLE_GROUP_MAP.get(role)
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the role as loaded so save() can detect changes without a query."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_role = instance.__dict__.get('role')
+        return instance
+    
     def save(self, *args, **kwargs):
         """
         Override save to sync role with corresponding Django Group.
+        The sync runs via transaction.on_commit, i.e. immediately in autocommit mode.
         """
         # Check if this is a new user or role has changed
         is_new = self.pk is None
-        old_role = None
-        
-        if not is_new:
-            try:
-                old_user = User.objects.get(pk=self.pk)
-                old_role = old_user.role
-            except User.DoesNotExist:
-                pass
+        old_role = None if is_new else getattr(self, '_loaded_role', None)
         
         # Save the user first
         super().save(*args, **kwargs)
+        self._loaded_role = self.role
         
-        # Sync group membership if role changed or is new user
+        # Sync group membership if role changed or is new user, once the save is committed
         if is_new or old_role != self.role:
-            self._sync_role_group()
+            for attr in ('_role_perms_cache', '_perm_cache', '_group_perm_cache'):
+                self.__dict__.pop(attr, None)
+            transaction.on_commit(self._sync_role_group)
+    
+    @classmethod
+    def _get_role_group_ids(cls):
+        """
+        Return the {role: group_id} map with one indexed lookup by name.
+        Missing role groups are created. Not cached across calls, since role
+        groups can be deleted and recreated (by an admin or post_migrate).
+        """
+        group_ids = dict(
+            Group.objects.filter(name__in=_ROLE_GROUP_NAMES).values_list('name', 'id')
+        )
+        for group_name in cls.ROLE_GROUP_MAP.values():
+            if group_name not in group_ids:
+                group, created = Group.objects.get_or_create(name=group_name)
+                group_ids[group_name] = group.id
+        return {role: group_ids[group_name] for role, group_name in cls.ROLE_GROUP_MAP.items()}
     
     def _sync_role_group(self):
         """
         Synchronize the user's group membership based on their role.
         Removes user from all role-based groups and adds to the correct one.
         """
-        # Get all role-based group names
-        role_group_names = list(self.ROLE_GROUP_MAP.values())
+        group_ids = self._get_role_group_ids()
+        target_id = group_ids.get(self.role)
         
-        # Remove user from all role-based groups
-        role_groups = Group.objects.filter(name__in=role_group_names)
-        for group in role_groups:
-            group.user_set.remove(self)
+        # Remove user from the other role-based groups
+        self.groups.remove(*[gid for gid in group_ids.values() if gid != target_id])
         
         # Add user to the correct group based on their role
-        group_name = self.ROLE_GROUP_MAP.get(self.role)
-        if group_name:
-            group, created = Group.objects.get_or_create(name=group_name)
-            group.user_set.add(self)
+        if target_id:
+            self.groups.add(target_id)
     
     def is_applicant(self):
         """Check if user is an applicant."""
@@ -126,33 +178,48 @@ class User(AbstractUser):
         """Check if user is an admin (not to be confused with Django's is_staff)."""
         return self.role == self.Role.ADMIN
     
-    def increment_load(self):
-        """Increment reviewer's current load."""
-        self.current_load += 1
-        self.save(update_fields=['current_load'])
+    def increment_load(self, refresh=True):
+        """
+        Increment reviewer's current load with a single atomic UPDATE.
+        Pass refresh=False when the caller does not need the new value.
+        """
+        type(self).objects.filter(pk=self.pk).update(current_load=F('current_load') + 1)
+        if refresh:
+            self.refresh_from_db(fields=['current_load'])
     
-    def decrement_load(self):
-        """Decrement reviewer's current load."""
-        if self.current_load > 0:
-            self.current_load -= 1
-            self.save(update_fields=['current_load'])
+    def decrement_load(self, refresh=True):
+        """
+        Decrement reviewer's current load with a single atomic UPDATE (never below zero).
+        Pass refresh=False when the caller does not need the new value.
+        """
+        type(self).objects.filter(pk=self.pk, current_load__gt=0).update(
+            current_load=F('current_load') - 1
+        )
+        if refresh:
+            self.refresh_from_db(fields=['current_load'])
     
     def get_role_permissions(self):
         """
         Get all permissions from the user's role-based group.
         Returns a set of permission codenames.
+        The result is cached on the instance; save() clears it when the role changes.
         """
-        group_name = self.ROLE_GROUP_MAP.get(self.role)
-        if group_name:
-            try:
-                group = Group.objects.get(name=group_name)
-                return set(group.permissions.values_list('codename', flat=True))
-            except Group.DoesNotExist:
-                pass
-        return set()
+        if '_role_perms_cache' not in self.__dict__:
+            group_name = self.group_for_role(self.role)
+            perms = set()
+            if group_name:
+                perms = set(
+                    Permission.objects.filter(group__name=group_name).values_list('codename', flat=True)
+                )
+            self._role_perms_cache = perms
+        return self._role_perms_cache
     
     def has_role_permission(self, perm_codename):
         """
         Check if user has a specific permission through their role-based group.
         """
         return perm_codename in self.get_role_permissions()
+
+
+# Names of all role-backed groups, built once at import
+_ROLE_GROUP_NAMES = frozenset(User.ROLE_GROUP_MAP.values())
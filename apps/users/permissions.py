@@ -84,8 +84,11 @@ def role_or_permission_required(roles=None, perms=None):
             # Check role
             has_role = request.user.role in roles if roles else False
             
-            # Check permissions
-            has_perm = any(request.user.has_perm(p) for p in perms) if perms else False
+            # Check permissions against the user's cached permission set
+            has_perm = False
+            if perms and not has_role:
+                perm_set = request.user.get_all_permissions()
+                has_perm = any(p in perm_set for p in perms)
             
             if not has_role and not has_perm:
                 raise PermissionDenied("You do not have permission to access this page.")
@@ -110,6 +113,30 @@ def admin_required(view_func):
     return role_required('ADMIN')(view_func)
 
 
+def annotate_permissions(queryset, user):
+    """
+    Annotate an Application queryset with the assignment flags read by
+    can_view_application and can_review_application, so checking a list of
+    applications needs no per-row queries.
+    
+    Adds:
+        has_assignment: user has any review assignment on the application
+        has_active_assignment: user has an ASSIGNED review assignment on it
+    """
+    from django.db.models import Exists, OuterRef
+    from apps.reviews.models import ReviewAssignment
+    
+    # Only reviewers consult the flags
+    if not user.is_authenticated or not user.is_reviewer():
+        return queryset
+    
+    assignments = ReviewAssignment.objects.filter(application=OuterRef('pk'), reviewer=user)
+    return queryset.annotate(
+        has_assignment=Exists(assignments),
+        has_active_assignment=Exists(assignments.filter(status='ASSIGNED')),
+    )
+
+
 def can_view_application(user, application):
     """
     Check if user can view an application.
@@ -119,6 +146,9 @@ def can_view_application(user, application):
     - Reviewer can view assigned applications
     - Admin can view all applications
     - Users with 'applications.view_application' permission can view all
+    
+    If the application comes from annotate_permissions() the annotated
+    ``has_assignment`` flag is used instead of a query.
     """
     # Check Django permission first
     if user.has_perm('applications.view_application'):
@@ -131,7 +161,10 @@ def can_view_application(user, application):
         return True
     
     if user.is_reviewer():
-        return application.reviewassignment_set.filter(reviewer=user).exists()
+        has_assignment = getattr(application, 'has_assignment', None)
+        if has_assignment is not None:
+            return has_assignment
+        return application.review_assignments.filter(reviewer=user).exists()
     
     return False
 
@@ -166,6 +199,8 @@ def can_review_application(user, application):
     - Reviewer must have an active assignment
     - Admin can review any application
     - Users with 'reviews.add_review' permission can review all
+    
+    The ``has_active_assignment`` flag from annotate_permissions() is used when present.
     """
     # Check Django permission first
     if user.has_perm('reviews.add_review'):
@@ -175,7 +210,10 @@ def can_review_application(user, application):
         return True
     
     if user.is_reviewer():
-        return application.reviewassignment_set.filter(
+        has_active_assignment = getattr(application, 'has_active_assignment', None)
+        if has_active_assignment is not None:
+            return has_active_assignment
+        return application.review_assignments.filter(
             reviewer=user,
             status='ASSIGNED'
         ).exists()
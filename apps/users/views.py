@@ -6,6 +6,8 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, logout
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db.models import Count, Q
 from .models import User
 from .forms import UserRegistrationForm, ProfileEditForm
 from .permissions import applicant_required, reviewer_required, admin_required
@@ -56,18 +58,24 @@ def dashboard(request):
 def applicant_dashboard(request):
     """Dashboard for applicants with comprehensive application status."""
     from apps.applications.models import Application
+    from apps.applications.services import DashboardCacheService
     
     applications = Application.objects.filter(applicant=request.user).order_by('-created_at')
     
+    # All status counts in a single query, cached until the applicant's applications change
+    stats = DashboardCacheService.get_or_set('applicant_counts', lambda: applications.aggregate(
+        total_count=Count('id'),
+        draft_count=Count('id', filter=Q(status='DRAFT')),
+        submitted_count=Count('id', filter=Q(status='SUBMITTED')),
+        under_review_count=Count('id', filter=Q(status='UNDER_REVIEW')),
+        approved_count=Count('id', filter=Q(status='APPROVED')),
+        rejected_count=Count('id', filter=Q(status='REJECTED')),
+        revision_requested_count=Count('id', filter=Q(status='REVISION_REQUESTED')),
+    ), applicant_id=request.user.pk)
+    
     context = {
-        'applications': applications,
-        'total_count': applications.count(),
-        'draft_count': applications.filter(status='DRAFT').count(),
-        'submitted_count': applications.filter(status='SUBMITTED').count(),
-        'under_review_count': applications.filter(status='UNDER_REVIEW').count(),
-        'approved_count': applications.filter(status='APPROVED').count(),
-        'rejected_count': applications.filter(status='REJECTED').count(),
-        'revision_requested_count': applications.filter(status='REVISION_REQUESTED').count(),
+        'applications': applications.only('id', 'title', 'status', 'submitted_at', 'updated_at'),
+        **stats,
     }
     
     return render(request, 'users/applicant_dashboard.html', context)
@@ -78,16 +86,21 @@ def reviewer_dashboard(request):
     """Dashboard for reviewers with comprehensive assignment tracking."""
     from apps.reviews.models import ReviewAssignment
     
-    assignments = ReviewAssignment.objects.filter(
-        reviewer=request.user
-    ).select_related('application', 'rubric').order_by('-assigned_date')
+    assignments = ReviewAssignment.objects.filter(reviewer=request.user)
+    
+    stats = assignments.aggregate(
+        total_count=Count('id'),
+        pending_count=Count('id', filter=Q(status='ASSIGNED')),
+        in_progress_count=Count('id', filter=Q(status='IN_PROGRESS')),
+        completed_count=Count('id', filter=Q(status='COMPLETED')),
+    )
     
     context = {
-        'assignments': assignments,
-        'total_count': assignments.count(),
-        'pending_count': assignments.filter(status='ASSIGNED').count(),
-        'in_progress_count': assignments.filter(status='IN_PROGRESS').count(),
-        'completed_count': assignments.filter(status='COMPLETED').count(),
+        'assignments': assignments.select_related('application', 'rubric').only(
+            'id', 'status', 'due_date', 'assigned_date',
+            'application__id', 'application__title', 'rubric__id', 'rubric__name'
+        ).order_by('-assigned_date'),
+        **stats,
     }
     
     return render(request, 'users/reviewer_dashboard.html', context)
@@ -97,22 +110,28 @@ def reviewer_dashboard(request):
 def admin_dashboard(request):
     """Dashboard for administrators."""
     from apps.applications.models import Application
-    from apps.reviews.models import ReviewAssignment
-    from django.db.models import Count, Avg
+    from apps.applications.services import DashboardCacheService
     
-    # Application statistics
+    # Application statistics (the total is derived from the per-status counts)
     applications = Application.objects.all()
-    app_stats = applications.values('status').annotate(count=Count('id'))
+    app_stats = DashboardCacheService.get_or_set(
+        'status_counts', lambda: list(applications.values('status').annotate(count=Count('id')))
+    )
     
     # Reviewer load statistics
-    reviewers = User.objects.filter(role=User.Role.REVIEWER).order_by('-current_load')
+    reviewers = User.objects.filter(role=User.Role.REVIEWER).only(
+        'id', 'username', 'first_name', 'last_name', 'current_load'
+    ).order_by('-current_load')
     
     # Recent activity
-    recent_applications = applications.order_by('-updated_at')[:10]
+    recent_applications = applications.select_related('applicant').only(
+        'id', 'title', 'status', 'updated_at',
+        'applicant__id', 'applicant__username', 'applicant__first_name', 'applicant__last_name'
+    ).order_by('-updated_at')[:10]
     
     context = {
         'app_stats': app_stats,
-        'total_applications': applications.count(),
+        'total_applications': sum(stat['count'] for stat in app_stats),
         'reviewers': reviewers,
         'recent_applications': recent_applications,
     }
@@ -151,21 +170,38 @@ def edit_profile(request):
 @admin_required
 def user_list(request):
     """Admin view to list and manage all users."""
-    users = User.objects.all().order_by('-date_joined')
+    users = User.objects.only(
+        'id', 'username', 'email', 'first_name', 'last_name',
+        'role', 'date_joined', 'current_load'
+    ).order_by('-date_joined')
     
     # Filter by role if requested
     role_filter = request.GET.get('role', '')
     if role_filter:
         users = users.filter(role=role_filter)
     
+    counts = User.objects.aggregate(
+        total_users=Count('id'),
+        applicant_count=Count('id', filter=Q(role='APPLICANT')),
+        reviewer_count=Count('id', filter=Q(role='REVIEWER')),
+        admin_count=Count('id', filter=Q(role='ADMIN')),
+    )
+    
+    paginator = Paginator(users, 50)
+    # Reuse the aggregate counts so the paginator doesn't issue its own COUNT(*);
+    # any other role value falls back to the paginator's own count
+    if not role_filter:
+        paginator.count = counts['total_users']
+    elif role_filter in User.Role.values:
+        paginator.count = counts[f'{role_filter.lower()}_count']
+    page_obj = paginator.get_page(request.GET.get('page'))
+    
     context = {
-        'users': users,
+        'users': page_obj,
+        'page_obj': page_obj,
         'role_filter': role_filter,
         'role_choices': User.Role.choices,
-        'total_users': User.objects.count(),
-        'applicant_count': User.objects.filter(role='APPLICANT').count(),
-        'reviewer_count': User.objects.filter(role='REVIEWER').count(),
-        'admin_count': User.objects.filter(role='ADMIN').count(),
+        **counts,
     }
     
     return render(request, 'users/user_list.html', context)
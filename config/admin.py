@@ -4,6 +4,8 @@ Django admin customization for Grant Application Workflow.
 
 from django.contrib import admin
 from django.contrib.admin import AdminSite
+from django.core.cache import cache
+from django.db import connection
 
 
 class GrantWorkflowAdminSite(AdminSite):
@@ -15,18 +17,35 @@ class GrantWorkflowAdminSite(AdminSite):
     
     def index(self, request, extra_context=None):
         """Override index to add stats counts."""
+        extra_context = extra_context or {}
+        extra_context.update(cache.get_or_set('admin_index_counts', self._get_index_counts, 30))
+        
+        return super().index(request, extra_context=extra_context)
+    
+    @staticmethod
+    def _get_index_counts():
+        """Fetch all index counts in a single round-trip."""
         from apps.applications.models import Application
         from apps.reviews.models import ReviewAssignment
         from apps.users.models import User
         from apps.notifications.models import Notification
         
-        extra_context = extra_context or {}
-        extra_context['app_count'] = Application.objects.count()
-        extra_context['review_count'] = ReviewAssignment.objects.count()
-        extra_context['user_count'] = User.objects.count()
-        extra_context['notif_count'] = Notification.objects.filter(is_read=False).count()
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT (SELECT COUNT(*) FROM {qn(Application._meta.db_table)}), "
+                f"(SELECT COUNT(*) FROM {qn(ReviewAssignment._meta.db_table)}), "
+                f"(SELECT COUNT(*) FROM {qn(User._meta.db_table)}), "
+                f"(SELECT COUNT(*) FROM {qn(Notification._meta.db_table)} WHERE is_read = false)"
+            )
+            app_count, review_count, user_count, notif_count = cursor.fetchone()
         
-        return super().index(request, extra_context=extra_context)
+        return {
+            'app_count': app_count,
+            'review_count': review_count,
+            'user_count': user_count,
+            'notif_count': notif_count,
+        }
     
     class Media:
         css = {
@@ -5,11 +5,9 @@ django.setup()
 
 from apps.users.models import User
 
-# Create test admin
-u = User.objects.create_user('testadmin', 'testadmin@test.com', 'demoPass123')
-u.role = 'ADMIN'
-u.is_staff = True
-u.first_name = 'Test'
-u.last_name = 'Admin'
-u.save()
+# Create test admin (single INSERT)
+u = User.objects.create_user(
+    'testadmin', 'testadmin@test.com', 'demoPass123',
+    role='ADMIN', is_staff=True, first_name='Test', last_name='Admin'
+)
 print('Created: testadmin / demoPass123')
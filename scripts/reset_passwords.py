@@ -8,18 +8,20 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from apps.users.models import User
 
 def reset_passwords():
     users = ['admin', 'reviewer1', 'reviewer2', 'reviewer3', 'applicant1', 'applicant2', 'applicant3']
-    for username in users:
-        try:
-            user = User.objects.get(username=username)
-            user.set_password('demoPass123')
-            user.save()
-            print(f"✓ Reset password for {username}")
-        except User.DoesNotExist:
-            print(f"✗ User {username} not found")
+    # One hash and one UPDATE for all demo users
+    updated = User.objects.filter(username__in=users).update(password=make_password('demoPass123'))
+    print(f"✓ Reset {updated} passwords")
+    
+    if updated < len(users):
+        found = set(User.objects.filter(username__in=users).values_list('username', flat=True))
+        for username in users:
+            if username not in found:
+                print(f"✗ User {username} not found")
 
 if __name__ == '__main__':
     reset_passwords()
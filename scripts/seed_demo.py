@@ -15,85 +15,78 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.utils import timezone
 from apps.users.models import User
 from apps.applications.models import Application, ApplicationVersion, DeadlineRule, ApplicationStatus
+from apps.applications.services import DashboardCacheService
 from apps.reviews.models import Rubric, Criterion, ReviewAssignment, Review
 from apps.notifications.models import EmailTemplate
 from apps.reviews.services import ReviewerAssignmentService
 
+# Enum members used while building demo rows, bound once at module level
+_ADMIN = User.Role.ADMIN
+_REVIEWER = User.Role.REVIEWER
+_APPLICANT = User.Role.APPLICANT
+_DRAFT = ApplicationStatus.DRAFT
+_SUBMITTED = ApplicationStatus.SUBMITTED
+_UNDER_REVIEW = ApplicationStatus.UNDER_REVIEW
+_REVIEW_SUBMITTED = Review.ReviewStatus.SUBMITTED
+_ASSIGNMENT_COMPLETED = ReviewAssignment.AssignmentStatus.COMPLETED
+
 
 def create_users():
     """Create demo users."""
     print("Creating users...")
     
-    # Admin user
-    admin, created = User.objects.get_or_create(
-        username='admin',
-        defaults={
-            'email': 'admin@example.com',
-            'first_name': 'Admin',
-            'last_name': 'User',
-            'role': User.Role.ADMIN,
-            'is_staff': True,
-            'is_superuser': True,
-        }
-    )
-    if created:
-        admin.set_password('demoPass123')
-        admin.save()
-        print(f"  ✓ Created admin: {admin.username}")
-    
-    # Reviewers
-    reviewers = []
-    reviewer_data = [
-        ('reviewer1', 'Alice', 'Smith', ['biology', 'genetics'], 'University A'),
-        ('reviewer2', 'Bob', 'Johnson', ['chemistry', 'materials'], 'University B'),
-        ('reviewer3', 'Carol', 'Williams', ['physics', 'astronomy'], 'University C'),
+    user_specs = [
+        # Admin user
+        {'username': 'admin', 'first_name': 'Admin', 'last_name': 'User', 'role': _ADMIN,
+         'is_staff': True, 'is_superuser': True},
+        # Reviewers
+        {'username': 'reviewer1', 'first_name': 'Alice', 'last_name': 'Smith', 'role': _REVIEWER,
+         'expertise_tags': ['biology', 'genetics'], 'organization': 'University A'},
+        {'username': 'reviewer2', 'first_name': 'Bob', 'last_name': 'Johnson', 'role': _REVIEWER,
+         'expertise_tags': ['chemistry', 'materials'], 'organization': 'University B'},
+        {'username': 'reviewer3', 'first_name': 'Carol', 'last_name': 'Williams', 'role': _REVIEWER,
+         'expertise_tags': ['physics', 'astronomy'], 'organization': 'University C'},
+        # Applicants
+        {'username': 'applicant1', 'first_name': 'David', 'last_name': 'Brown', 'role': _APPLICANT,
+         'organization': 'Research Institute X'},
+        {'username': 'applicant2', 'first_name': 'Emma', 'last_name': 'Davis', 'role': _APPLICANT,
+         'organization': 'University D'},
+        {'username': 'applicant3', 'first_name': 'Frank', 'last_name': 'Miller', 'role': _APPLICANT,
+         'organization': 'Lab Y'},
     ]
     
-    for username, first, last, tags, org in reviewer_data:
-        reviewer, created = User.objects.get_or_create(
-            username=username,
-            defaults={
-                'email': f'{username}@example.com',
-                'first_name': first,
-                'last_name': last,
-                'role': User.Role.REVIEWER,
-                'expertise_tags': tags,
-                'organization': org,
-            }
-        )
-        if created:
-            reviewer.set_password('demoPass123')
-            reviewer.save()
-            print(f"  ✓ Created reviewer: {reviewer.username}")
-        reviewers.append(reviewer)
+    # One IN query for the users that already exist
+    users = User.objects.in_bulk([spec['username'] for spec in user_specs], field_name='username')
     
-    # Applicants
-    applicants = []
-    applicant_data = [
-        ('applicant1', 'David', 'Brown', 'Research Institute X'),
-        ('applicant2', 'Emma', 'Davis', 'University D'),
-        ('applicant3', 'Frank', 'Miller', 'Lab Y'),
+    # Hash the shared demo password once rather than once per user
+    password = make_password('demoPass123')
+    new_users = [
+        User(email=f"{spec['username']}@example.com", password=password, **spec)
+        for spec in user_specs if spec['username'] not in users
     ]
     
-    for username, first, last, org in applicant_data:
-        applicant, created = User.objects.get_or_create(
-            username=username,
-            defaults={
-                'email': f'{username}@example.com',
-                'first_name': first,
-                'last_name': last,
-                'role': User.Role.APPLICANT,
-                'organization': org,
-            }
-        )
-        if created:
-            applicant.set_password('demoPass123')
-            applicant.save()
-            print(f"  ✓ Created applicant: {applicant.username}")
-        applicants.append(applicant)
+    if new_users:
+        # expertise_tags lists are passed as-is; the JSONField adapts them within the multi-row INSERT
+        User.objects.bulk_create(new_users, batch_size=100)
+        # bulk_create bypasses User.save(), so add the role group memberships directly
+        group_ids = User._get_role_group_ids()
+        User.groups.through.objects.bulk_create([
+            User.groups.through(user_id=user.pk, group_id=group_ids[user.role])
+            for user in new_users
+        ], batch_size=100)
+        for user in new_users:
+            users[user.username] = user
+        print("\n".join(f"  ✓ Created {user.get_role_display().lower()}: {user.username}" for user in new_users))
+    
+    ordered = [users[spec['username']] for spec in user_specs]
+    admin = ordered[0]
+    reviewers = [user for user in ordered if user.role == _REVIEWER]
+    applicants = [user for user in ordered if user.role == _APPLICANT]
     
     return admin, reviewers, applicants
 
@@ -122,8 +115,8 @@ def create_rubrics():
             ('Team Qualifications', 'Expertise and track record', 10, 0, 10, True, 5),
         ]
         
-        for name, desc, weight, min_s, max_s, req, order in criteria_data:
-            Criterion.objects.create(
+        Criterion.objects.bulk_create([
+            Criterion(
                 rubric=rubric,
                 name=name,
                 description=desc,
@@ -133,67 +126,90 @@ def create_rubrics():
                 is_required=req,
                 order=order
             )
-            print(f"    ✓ Created criterion: {name}")
+            for name, desc, weight, min_s, max_s, req, order in criteria_data
+        ], batch_size=100)
+        print(f"    ✓ Created {len(criteria_data)} criteria: {', '.join(c[0] for c in criteria_data)}")
     
     return rubric
 
 
-def create_applications(applicants, rubric):
+def create_applications(applicants, rubric, now):
     """Create demo applications."""
     print("\nCreating applications...")
     
     applications = []
+    created_msgs = []
     app_data = [
-        ('Novel Approach to Cancer Research', 'Biology Research 2024', 'biology', ApplicationStatus.UNDER_REVIEW, 250000),
-        ('Advanced Materials for Energy Storage', 'Materials Science 2024', 'chemistry', ApplicationStatus.SUBMITTED, 180000),
-        ('Exoplanet Detection Methods', 'Astronomy Grants 2024', 'physics', ApplicationStatus.DRAFT, 320000),
+        ('Novel Approach to Cancer Research', 'Biology Research 2024', 'biology', _UNDER_REVIEW, 250000),
+        ('Advanced Materials for Energy Storage', 'Materials Science 2024', 'chemistry', _SUBMITTED, 180000),
+        ('Exoplanet Detection Methods', 'Astronomy Grants 2024', 'physics', _DRAFT, 320000),
     ]
     
+    existing = {
+        (app.title, app.applicant_id): app
+        for app in Application.objects.filter(title__in=[data[0] for data in app_data])
+    }
+    
+    new_apps = []
     for i, (title, program, tag, status, amount) in enumerate(app_data):
         applicant = applicants[i % len(applicants)]
         
-        app, created = Application.objects.get_or_create(
-            title=title,
-            applicant=applicant,
-            defaults={
-                'call_program': program,
-                'abstract': f'This is a demo application for {title}. The research aims to advance our understanding in the field.',
-                'requested_amount': Decimal(str(amount)),
-                'status': status,
-                'submitted_at': timezone.now() - timedelta(days=10) if status != ApplicationStatus.DRAFT else None,
-                'deadline': timezone.now() + timedelta(days=30),
-                'tags': [tag, 'research'],
-            }
-        )
+        app = existing.get((title, applicant.pk))
+        if app is None:
+            app = Application(
+                title=title,
+                applicant=applicant,
+                call_program=program,
+                abstract=f'This is a demo application for {title}. The research aims to advance our understanding in the field.',
+                requested_amount=Decimal(str(amount)),
+                status=status,
+                submitted_at=now - timedelta(days=10) if status != _DRAFT else None,
+                deadline=now + timedelta(days=30),
+                tags=[tag, 'research'],
+            )
+            new_apps.append(app)
+            created_msgs.append(f"  ✓ Created application: {app.title}")
         
-        if created:
-            print(f"  ✓ Created application: {app.title}")
-            
-            # Create version
-            ApplicationVersion.objects.create(
-                application=app,
+        applications.append(app)
+    
+    if new_apps:
+        Application.objects.bulk_create(new_apps, batch_size=100)
+        
+        # Initial version for each new application
+        ApplicationVersion.objects.bulk_create([
+            ApplicationVersion(
+                application_id=app.pk,
                 version_number=1,
                 data={
-                    'title': title,
+                    'title': app.title,
                     'abstract': app.abstract,
                     'methodology': 'Demo methodology',
                     'timeline': '12 months',
                 },
-                created_by=applicant,
+                created_by=app.applicant,
                 change_summary='Initial version'
             )
+            for app in new_apps
+        ], batch_size=100)
         
-        applications.append(app)
+        # bulk_create skips post_save, so drop cached dashboard counts explicitly
+        for applicant_id in {app.applicant_id for app in new_apps}:
+            DashboardCacheService.invalidate(applicant_id)
+    
+    if created_msgs:
+        print("\n".join(created_msgs))
     
     return applications
 
 
-def create_reviews(applications, reviewers, rubric, admin):
+def create_reviews(applications, reviewers, rubric, admin, now):
     """Create demo review assignments and reviews."""
     print("\nCreating review assignments...")
     
     # Assign reviewers to first application
     app = applications[0]
+    criterion_keys = [str(cid) for cid in rubric.criteria.values_list('id', flat=True)]
+    created_msgs = []
     
     for i, reviewer in enumerate(reviewers[:2]):  # Assign 2 reviewers
         assignment, error = ReviewerAssignmentService.assign_reviewer(
@@ -206,28 +222,31 @@ def create_reviews(applications, reviewers, rubric, admin):
         )
         
         if assignment:
-            print(f"  ✓ Assigned {reviewer.username} to {app.title}")
+            created_msgs.append(f"  ✓ Assigned {reviewer.username} to {app.title}")
             
             # Create a completed review for first reviewer
             if i == 0:
+                # Score computed up front so the review is a single INSERT
+                scores = dict.fromkeys(criterion_keys, 8)
                 review = Review.objects.create(
                     assignment=assignment,
-                    scores={
-                        str(c.id): 8 for c in rubric.criteria.all()
-                    },
+                    scores=scores,
+                    overall_score=rubric.calculate_weighted_score(scores),
                     strengths='Strong scientific merit and innovative approach.',
                     weaknesses='Timeline could be more detailed.',
                     recommendation='Recommend for funding with minor revisions.',
-                    status=Review.ReviewStatus.SUBMITTED,
-                    submitted_at=timezone.now() - timedelta(days=2)
+                    status=_REVIEW_SUBMITTED,
+                    submitted_at=now - timedelta(days=2)
                 )
-                review.calculate_overall_score()
-                review.save()
                 
-                assignment.status = ReviewAssignment.AssignmentStatus.COMPLETED
-                assignment.save()
+                assignment.status = _ASSIGNMENT_COMPLETED
+                assignment.overall_score = review.overall_score
+                assignment.save(update_fields=['status', 'overall_score'])
                 
-                print(f"    ✓ Created completed review")
+                created_msgs.append("    ✓ Created completed review")
+    
+    if created_msgs:
+        print("\n".join(created_msgs))
 
 
 def create_email_templates():
@@ -248,18 +267,16 @@ def create_email_templates():
          'Dear {{reviewer_name}},\n\nThis is a reminder that your review for "{{application_title}}" is due on {{due_date}}.\n\nThank you!'),
     ]
     
-    for name, template_type, subject, body in templates:
-        template, created = EmailTemplate.objects.get_or_create(
-            name=name,
-            defaults={
-                'template_type': template_type,
-                'subject': subject,
-                'body': body,
-                'is_active': True,
-            }
-        )
-        if created:
-            print(f"  ✓ Created template: {name}")
+    existing = set(
+        EmailTemplate.objects.filter(name__in=[t[0] for t in templates]).values_list('name', flat=True)
+    )
+    to_create = [
+        EmailTemplate(name=name, template_type=template_type, subject=subject, body=body, is_active=True)
+        for name, template_type, subject, body in templates if name not in existing
+    ]
+    EmailTemplate.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+    if to_create:
+        print("\n".join(f"  ✓ Created template: {template.name}" for template in to_create))
 
 
 def create_deadline_rules():
@@ -287,27 +304,39 @@ def main():
     print("Grant Application Workflow - Demo Data Seeding")
     print("=" * 60)
     
-    admin, reviewers, applicants = create_users()
-    rubric = create_rubrics()
-    applications = create_applications(applicants, rubric)
-    create_reviews(applications, reviewers, rubric, admin)
-    create_email_templates()
-    create_deadline_rules()
+    # The deadline rule is seeded last in the same transaction, so it marks a complete seed
+    if not os.environ.get('FORCE_SEED') and DeadlineRule.objects.filter(name='Standard Review Deadline').exists():
+        print("Demo data already seeded; set FORCE_SEED=1 to run anyway.")
+        return
     
-    print("\n" + "=" * 60)
-    print("Demo data seeding completed successfully!")
-    print("=" * 60)
-    print("\nLogin credentials:")
-    print("  Admin:      admin / demoPass123")
-    print("  Reviewer 1: reviewer1 / demoPass123")
-    print("  Reviewer 2: reviewer2 / demoPass123")
-    print("  Reviewer 3: reviewer3 / demoPass123")
-    print("  Applicant 1: applicant1 / demoPass123")
-    print("  Applicant 2: applicant2 / demoPass123")
-    print("  Applicant 3: applicant3 / demoPass123")
-    print("\nAccess the application at: http://localhost:8000")
-    print("Access the admin panel at: http://localhost:8000/admin")
-    print("=" * 60)
+    # One timestamp shared by every seeded row
+    now = timezone.now()
+    
+    # Seed everything in one transaction: one commit instead of one per INSERT
+    with transaction.atomic():
+        admin, reviewers, applicants = create_users()
+        rubric = create_rubrics()
+        applications = create_applications(applicants, rubric, now)
+        create_reviews(applications, reviewers, rubric, admin, now)
+        create_email_templates()
+        create_deadline_rules()
+    
+    print("\n".join([
+        "\n" + "=" * 60,
+        "Demo data seeding completed successfully!",
+        "=" * 60,
+        "\nLogin credentials:",
+        "  Admin:      admin / demoPass123",
+        "  Reviewer 1: reviewer1 / demoPass123",
+        "  Reviewer 2: reviewer2 / demoPass123",
+        "  Reviewer 3: reviewer3 / demoPass123",
+        "  Applicant 1: applicant1 / demoPass123",
+        "  Applicant 2: applicant2 / demoPass123",
+        "  Applicant 3: applicant3 / demoPass123",
+        "\nAccess the application at: http://localhost:8000",
+        "Access the admin panel at: http://localhost:8000/admin",
+        "=" * 60,
+    ]))
 
 
 if __name__ == '__main__':
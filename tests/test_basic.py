@@ -3,7 +3,8 @@ Basic tests for Grant Application Workflow.
 """
 
 import pytest
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from apps.users.models import User
 from apps.applications.models import Application, ApplicationStatus
 from apps.applications.state_machine import ApplicationStateMachine, StateTransitionError
@@ -40,20 +41,59 @@ class UserModelTest(TestCase):
         
         reviewer.decrement_load()
         assert reviewer.current_load == 0
+    
+    def test_role_group_sync(self):
+        """Test group membership follows the role once the save commits."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            user = User.objects.create_user(username='member', role=User.Role.APPLICANT)
+            
+            # Deferred until commit
+            assert not user.groups.exists()
+        
+        assert len(callbacks) == 1
+        assert list(user.groups.values_list('name', flat=True)) == ['Applicants']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            user.role = User.Role.REVIEWER
+            user.save()
+        
+        assert list(user.groups.values_list('name', flat=True)) == ['Reviewers']
+        
+        # Saving without a role change schedules no sync
+        with self.captureOnCommitCallbacks() as callbacks:
+            user.save()
+        
+        assert callbacks == []
+    
+    def test_role_group_recreated(self):
+        """Test the sync finds a role group that was deleted and recreated."""
+        from django.contrib.auth.models import Group
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username='first', role=User.Role.REVIEWER)
+        
+        Group.objects.filter(name='Reviewers').delete()
+        recreated = Group.objects.create(name='Reviewers')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(username='second', role=User.Role.REVIEWER)
+        
+        assert list(user.groups.all()) == [recreated]
 
 
 class ApplicationStateMachineTest(TestCase):
     """Tests for application state machine."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.applicant = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class; each test gets its own copy."""
+        cls.applicant = User.objects.create_user(
             username='applicant',
             role=User.Role.APPLICANT
         )
         
-        self.application = Application.objects.create(
-            applicant=self.applicant,
+        cls.application = Application.objects.create(
+            applicant=cls.applicant,
             title='Test Application',
             call_program='Test Program',
             abstract='Test abstract',
@@ -88,9 +128,420 @@ class ApplicationStateMachineTest(TestCase):
         sm = ApplicationStateMachine(self.application)
         sm.transition_to(ApplicationStatus.SUBMITTED, actor=self.applicant, reason='Test submission')
         
-        logs = AuditLog.objects.filter(application=self.application)
+        logs = AuditLog.objects.filter(application=self.application).select_related('actor')
         assert logs.count() > 0
         
         log = logs.first()
         assert log.action_type == AuditLog.ActionType.STATE_CHANGE
         assert log.actor == self.applicant
+    
+    def test_transition_query_count(self):
+        """Test a transition issues one narrow UPDATE plus the audit log INSERT."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        sm = ApplicationStateMachine(self.application)
+        with CaptureQueriesContext(connection) as ctx:
+            sm.transition_to(ApplicationStatus.SUBMITTED, actor=self.applicant)
+        
+        assert len(ctx.captured_queries) == 2
+        
+        # Only the transition columns are written
+        update_sql = ctx.captured_queries[0]['sql']
+        assert update_sql.startswith('UPDATE')
+        assert '"status"' in update_sql
+        assert '"title"' not in update_sql
+        assert '"abstract"' not in update_sql
+
+
+class ReviewerAssignmentServiceTest(TestCase):
+    """Tests for reviewer assignment."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up an application, a rubric and a few reviewers."""
+        from apps.reviews.models import Rubric, COIFlag
+        
+        cls.admin = User.objects.create_user(username='admin', role=User.Role.ADMIN)
+        applicant = User.objects.create_user(username='applicant', role=User.Role.APPLICANT)
+        cls.application = Application.objects.create(
+            applicant=applicant,
+            title='Test Application',
+            call_program='Test Program',
+            abstract='Test abstract',
+            requested_amount=100000,
+            status=ApplicationStatus.SUBMITTED
+        )
+        cls.rubric = Rubric.objects.create(name='Test Rubric')
+        cls.reviewers = [
+            User.objects.create_user(username=f'reviewer{i}', role=User.Role.REVIEWER)
+            for i in range(3)
+        ]
+        cls.conflicted = User.objects.create_user(username='conflicted', role=User.Role.REVIEWER)
+        COIFlag.objects.create(
+            reviewer=cls.conflicted,
+            application=cls.application,
+            coi_type=COIFlag.COIType.PERSONAL,
+            description='Test conflict'
+        )
+    
+    def test_assign_reviewer(self):
+        """Test a single assignment increments load and writes an audit log."""
+        from apps.applications.models import AuditLog
+        from apps.reviews.services import ReviewerAssignmentService, ALREADY_ASSIGNED_ERROR
+        
+        reviewer = self.reviewers[0]
+        assignment, error = ReviewerAssignmentService.assign_reviewer(
+            self.application, reviewer, self.rubric, self.admin
+        )
+        
+        assert error is None
+        assert assignment.reviewer == reviewer
+        reviewer.refresh_from_db()
+        assert reviewer.current_load == 1
+        assert AuditLog.objects.filter(
+            application=self.application,
+            action_type=AuditLog.ActionType.REVIEW_ASSIGNED
+        ).count() == 1
+        
+        # A second assignment hits the unique constraint and changes nothing
+        assignment, error = ReviewerAssignmentService.assign_reviewer(
+            self.application, reviewer, self.rubric, self.admin
+        )
+        
+        assert assignment is None
+        assert error == ALREADY_ASSIGNED_ERROR
+        reviewer.refresh_from_db()
+        assert reviewer.current_load == 1
+    
+    def test_assign_reviewer_coi(self):
+        """Test a reviewer with a conflict of interest is refused."""
+        from apps.reviews.services import ReviewerAssignmentService, COI_ERROR
+        
+        assignment, error = ReviewerAssignmentService.assign_reviewer(
+            self.application, self.conflicted, self.rubric, self.admin
+        )
+        
+        assert assignment is None
+        assert error == COI_ERROR
+    
+    def test_bulk_assign_reviewers(self):
+        """Test bulk assignment skips unknown, conflicted, assigned and repeated ids."""
+        from apps.applications.models import AuditLog
+        from apps.reviews.models import ReviewAssignment
+        from apps.reviews.services import (
+            ReviewerAssignmentService, COI_ERROR, ALREADY_ASSIGNED_ERROR
+        )
+        
+        first, second, third = self.reviewers
+        ReviewerAssignmentService.assign_reviewer(self.application, first, self.rubric, self.admin)
+        
+        assignments, errors = ReviewerAssignmentService.bulk_assign_reviewers(
+            self.application,
+            [str(second.pk), third.pk, third.pk, first.pk, self.conflicted.pk, 999999],
+            self.rubric,
+            self.admin
+        )
+        
+        assert [a.reviewer_id for a in assignments] == [second.pk, third.pk]
+        assert errors == [
+            f"{third.username}: {ALREADY_ASSIGNED_ERROR}",
+            f"{first.username}: {ALREADY_ASSIGNED_ERROR}",
+            f"{self.conflicted.username}: {COI_ERROR}",
+            "Reviewer ID 999999 not found",
+        ]
+        assert ReviewAssignment.objects.filter(application=self.application).count() == 3
+        
+        loads = dict(
+            User.objects.filter(role=User.Role.REVIEWER).values_list('username', 'current_load')
+        )
+        assert loads == {first.username: 1, second.username: 1, third.username: 1, 'conflicted': 0}
+        
+        audited = set(
+            AuditLog.objects.filter(
+                application=self.application,
+                action_type=AuditLog.ActionType.REVIEW_ASSIGNED
+            ).values_list('details__reviewer_id', flat=True)
+        )
+        assert audited == {str(first.pk), str(second.pk), str(third.pk)}
+
+
+@override_settings(DASHBOARD_CACHE_ENABLED=True)
+class DashboardCacheServiceTest(TestCase):
+    """Tests for cached dashboard aggregates."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up an applicant with one draft application."""
+        cls.applicant = User.objects.create_user(username='applicant', role=User.Role.APPLICANT)
+        cls.application = Application.objects.create(
+            applicant=cls.applicant,
+            title='Test Application',
+            call_program='Test Program',
+            abstract='Test abstract',
+            requested_amount=100000,
+            status=ApplicationStatus.DRAFT
+        )
+    
+    def setUp(self):
+        cache.clear()
+    
+    def _draft_count(self):
+        from apps.applications.services import DashboardCacheService
+        
+        return DashboardCacheService.get_or_set(
+            'draft_count',
+            lambda: Application.objects.filter(
+                applicant=self.applicant, status=ApplicationStatus.DRAFT
+            ).count(),
+            applicant_id=self.applicant.pk
+        )
+    
+    def test_cached_until_commit(self):
+        """Test counts stay cached until a save or delete commits."""
+        assert self._draft_count() == 1
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.application.status = ApplicationStatus.SUBMITTED
+            self.application.save()
+            
+            # Not invalidated before the transaction commits
+            assert self._draft_count() == 1
+        
+        assert self._draft_count() == 0
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Application.objects.create(
+                applicant=self.applicant,
+                title='Second Application',
+                call_program='Test Program',
+                abstract='Test abstract',
+                requested_amount=50000,
+                status=ApplicationStatus.DRAFT
+            )
+        
+        assert self._draft_count() == 1
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Application.objects.filter(title='Second Application').get().delete()
+        
+        assert self._draft_count() == 0
+    
+    @override_settings(DASHBOARD_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        """Test nothing is cached with a per-process cache."""
+        assert self._draft_count() == 1
+        
+        Application.objects.filter(pk=self.application.pk).update(status=ApplicationStatus.SUBMITTED)
+        
+        assert self._draft_count() == 0
+
+
+class RolePermissionBackendTest(TestCase):
+    """Tests for permissions granted through the role group."""
+    
+    PERM = 'applications.view_application'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a reviewer whose role group membership has been synced."""
+        from django.contrib.auth.models import Group, Permission
+        
+        cls.reviewers = Group.objects.get(name='Reviewers')
+        cls.permission = Permission.objects.get(
+            content_type__app_label='applications', codename='view_application'
+        )
+        cls.reviewer = User.objects.create_user(username='reviewer', role=User.Role.REVIEWER)
+        cls.reviewer._sync_role_group()
+    
+    def _fresh_reviewer(self):
+        return User.objects.get(pk=self.reviewer.pk)
+    
+    def test_grant_and_revoke(self):
+        """Test granting and revoking a group permission shows up on the next load."""
+        assert not self._fresh_reviewer().has_perm(self.PERM)
+        
+        self.reviewers.permissions.add(self.permission)
+        assert self._fresh_reviewer().has_perm(self.PERM)
+        
+        self.reviewers.permissions.remove(self.permission)
+        assert not self._fresh_reviewer().has_perm(self.PERM)
+    
+    def test_requires_group_membership(self):
+        """Test the role alone grants nothing without membership in its group."""
+        self.reviewers.permissions.add(self.permission)
+        
+        # on_commit never runs here, so the group sync is skipped
+        outsider = User.objects.create_user(username='outsider', role=User.Role.REVIEWER)
+        
+        assert not outsider.groups.exists()
+        assert not outsider.has_perm(self.PERM)
+    
+    def test_role_change(self):
+        """Test a role change drops the cached role permissions."""
+        self.reviewers.permissions.add(self.permission)
+        
+        reviewer = self._fresh_reviewer()
+        assert reviewer.has_perm(self.PERM)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            reviewer.role = User.Role.APPLICANT
+            reviewer.save()
+        
+        assert not reviewer.has_perm(self.PERM)
+    
+    def test_permissions_in_one_query(self):
+        """Test direct and role-group permissions load together, once per instance."""
+        from django.contrib.auth.models import Permission
+        
+        self.reviewers.permissions.add(self.permission)
+        self.reviewer.user_permissions.add(
+            Permission.objects.get(content_type__app_label='reviews', codename='view_review')
+        )
+        
+        reviewer = self._fresh_reviewer()
+        with self.assertNumQueries(1):
+            assert reviewer.has_perm(self.PERM)
+            assert reviewer.has_perm('reviews.view_review')
+            assert not reviewer.has_perm('applications.delete_application')
+        
+        assert reviewer.get_user_permissions() == {'reviews.view_review'}
+        assert reviewer.get_group_permissions() == {self.PERM}
+    
+    def test_authentication_left_to_model_backend(self):
+        """Test logins keep using ModelBackend's session path."""
+        from django.contrib.auth import authenticate
+        
+        self.reviewer.set_password('testpass123')
+        self.reviewer.save()
+        
+        user = authenticate(username='reviewer', password='testpass123')
+        assert user == self.reviewer
+        assert user.backend == 'django.contrib.auth.backends.ModelBackend'
+
+
+class ScoringServiceTest(TestCase):
+    """Tests for review score statistics."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up an application with two assignments under one rubric."""
+        from apps.reviews.models import Rubric, ReviewAssignment
+        
+        applicant = User.objects.create_user(username='applicant', role=User.Role.APPLICANT)
+        cls.application = Application.objects.create(
+            applicant=applicant,
+            title='Test Application',
+            call_program='Test Program',
+            abstract='Test abstract',
+            requested_amount=100000,
+            status=ApplicationStatus.UNDER_REVIEW
+        )
+        cls.rubric = Rubric.objects.create(name='Test Rubric')
+        cls.assignments = [
+            ReviewAssignment.objects.create(
+                application=cls.application,
+                reviewer=User.objects.create_user(username=f'reviewer{i}', role=User.Role.REVIEWER),
+                rubric=cls.rubric
+            )
+            for i in range(2)
+        ]
+    
+    def _submitted_review(self, assignment, overall_score, scores=None):
+        from apps.reviews.models import Review
+        
+        return Review.objects.create(
+            assignment=assignment,
+            scores=scores or {},
+            overall_score=overall_score,
+            status=Review.ReviewStatus.SUBMITTED
+        )
+    
+    def test_application_statistics_follow_review_status(self):
+        """Test reverted and deleted reviews drop out of the statistics."""
+        from apps.reviews.models import Review
+        from apps.reviews.services import ScoringService
+        
+        first = self._submitted_review(self.assignments[0], 80)
+        second = self._submitted_review(self.assignments[1], 60)
+        
+        stats = ScoringService.calculate_application_statistics(self.application)
+        assert stats['review_count'] == 2
+        assert stats['mean_score'] == 70
+        
+        # Reverted to draft (e.g. in the admin)
+        first.status = Review.ReviewStatus.DRAFT
+        first.save()
+        
+        stats = ScoringService.calculate_application_statistics(self.application)
+        assert stats['review_count'] == 1
+        assert stats['mean_score'] == 60
+        
+        second.delete()
+        
+        stats = ScoringService.calculate_application_statistics(self.application)
+        assert stats['review_count'] == 0
+    
+    def test_criterion_statistics(self):
+        """Test per-criterion statistics over the JSON scores of submitted reviews."""
+        import math
+        from apps.reviews.models import Criterion, Review, ReviewAssignment
+        from apps.reviews.services import ScoringService
+        
+        merit, impact, budget = [
+            Criterion.objects.create(rubric=self.rubric, name=name, description=name, weight=1)
+            for name in ('Merit', 'Impact', 'Budget')
+        ]
+        assignments = self.assignments + [
+            ReviewAssignment.objects.create(
+                application=self.application,
+                reviewer=User.objects.create_user(username=f'extra{i}', role=User.Role.REVIEWER),
+                rubric=self.rubric
+            )
+            for i in range(2)
+        ]
+        
+        # Budget is never scored; Impact is missing from one review
+        self._submitted_review(assignments[0], 70, {str(merit.id): 8, str(impact.id): 5})
+        self._submitted_review(assignments[1], 60, {str(merit.id): 6})
+        self._submitted_review(assignments[2], 80, {str(merit.id): 7, str(impact.id): 9.5})
+        
+        # Drafts are ignored
+        Review.objects.create(assignment=assignments[3], scores={str(merit.id): 1, str(budget.id): 1})
+        
+        stats = ScoringService.calculate_criterion_statistics(self.rubric)
+        
+        assert set(stats) == {str(merit.id), str(impact.id)}
+        assert stats[str(merit.id)] == {
+            'criterion_name': 'Merit',
+            'count': 3,
+            'mean': 7.0,
+            'min': 6.0,
+            'max': 8.0,
+            'std_dev': 1.0,
+        }
+        
+        impact_stats = stats[str(impact.id)]
+        assert impact_stats['count'] == 2
+        assert impact_stats['mean'] == 7.25
+        assert (impact_stats['min'], impact_stats['max']) == (5.0, 9.5)
+        assert math.isclose(impact_stats['std_dev'], math.sqrt(10.125))
+        
+        # Limited to the given applications
+        other = Application.objects.create(
+            applicant=self.application.applicant,
+            title='Other Application',
+            call_program='Test Program',
+            abstract='Test abstract',
+            requested_amount=1000,
+            status=ApplicationStatus.UNDER_REVIEW
+        )
+        stats = ScoringService.calculate_criterion_statistics(
+            self.rubric, Application.objects.filter(pk__in=[self.application.pk, other.pk])
+        )
+        assert stats[str(merit.id)]['count'] == 3
+        
+        stats = ScoringService.calculate_criterion_statistics(
+            self.rubric, Application.objects.filter(pk=other.pk)
+        )
+        assert stats == {}